@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+from operator import attrgetter
+
 from schema import new_run_id
 from trace import TraceLogger
 from retrieve import load_sample_evidence, retrieve_top_k
 from judge import judge_evidence, judge_final
 from respond import build_answer_candidates
 
+_coverage = attrgetter("estimated_coverage")
+
 
 def main():
     run_id = new_run_id()
@@ -39,7 +43,7 @@ def main():
         final_answer = f"STOP: {reason_code}\nExtra: {extra}\nNo answer was produced due to policy."
         citations = []
     else:
-        best = max(candidates, key=lambda c: c.estimated_coverage)
+        best = max(candidates, key=_coverage)
         final_answer = best.text
         citations = best.cited_evidence_ids
 
@@ -29,6 +29,27 @@ class JudgmentResult:
     reason: str
 
 
+# Rule bits set by _keyword_mask, one per keyword rule.
+_PHYSICAL = 1   # Rule 2: physical products
+_VAGUE = 2      # Rule 3: vague reference
+_TOPIC = 4      # Rule 4: on-topic keyword
+
+
+def _keyword_mask(text: str) -> int:
+    # Lowercase once and set one bit per keyword rule. All three groups are
+    # checked eagerly, so "physical" is scanned even for non-software queries
+    # that never read _PHYSICAL; that is one cheap substring test, by design.
+    text_lower = text.lower()
+    mask = 0
+    if "physical" in text_lower:
+        mask |= _PHYSICAL
+    if "contact support" in text_lower or "different polic" in text_lower:
+        mask |= _VAGUE
+    if "return" in text_lower or "refund" in text_lower or "policy" in text_lower:
+        mask |= _TOPIC
+    return mask
+
+
 def judge_evidence(evidence: Evidence, query: str) -> JudgmentResult:
     """
     Evidence Judge: Decides if evidence is acceptable.
@@ -42,6 +63,21 @@ def judge_evidence(evidence: Evidence, query: str) -> JudgmentResult:
     (confidence, relevance, specificity, topic match).
     STOP is a final judgment outcome, not a threshold failure.
     """
+    return _judge(evidence, "software" in query.lower())
+
+
+def judge_all(evidence_list: List[Evidence], query: str) -> List[JudgmentResult]:
+    """
+    Judge a batch of evidence against one query.
+
+    Query-side work (lowercasing, topic detection) is done once for the
+    whole batch instead of once per evidence item.
+    """
+    query_is_software = "software" in query.lower()
+    return [_judge(e, query_is_software) for e in evidence_list]
+
+
+def _judge(evidence: Evidence, query_is_software: bool) -> JudgmentResult:
     # Rule 1: Low confidence → REJECT
     if evidence.confidence < 0.5:
         return JudgmentResult(
@@ -51,11 +87,10 @@ def judge_evidence(evidence: Evidence, query: str) -> JudgmentResult:
         )
 
     # Rule 2: Check if evidence actually addresses the query
-    query_lower = query.lower()
-    text_lower = evidence.text.lower()
+    mask = _keyword_mask(evidence.text)
 
     # For "software" query, reject "physical products" evidence
-    if "software" in query_lower and "physical" in text_lower:
+    if query_is_software and mask & _PHYSICAL:
         return JudgmentResult(
             evidence_id=evidence.id,
             decision="REJECT",
@@ -63,7 +98,7 @@ def judge_evidence(evidence: Evidence, query: str) -> JudgmentResult:
         )
 
     # Rule 3: Vague references → DEFER
-    if "contact support" in text_lower or "different polic" in text_lower:
+    if mask & _VAGUE:
         return JudgmentResult(
             evidence_id=evidence.id,
             decision="DEFER",
@@ -71,8 +106,7 @@ def judge_evidence(evidence: Evidence, query: str) -> JudgmentResult:
         )
 
     # Rule 4: Off-topic → REJECT
-    keywords = ["return", "refund", "policy"]
-    if not any(kw in text_lower for kw in keywords):
+    if not mask & _TOPIC:
         return JudgmentResult(
             evidence_id=evidence.id,
             decision="REJECT",
@@ -143,13 +177,10 @@ def main():
     print("Evidence Judgment Phase")
     print("=" * 70)
 
-    judgments: List[JudgmentResult] = []
+    judgments: List[JudgmentResult] = judge_all(evidence_candidates, query)
     accepted_evidence = []
 
-    for evidence in evidence_candidates:
-        judgment = judge_evidence(evidence, query)
-        judgments.append(judgment)
-
+    for evidence, judgment in zip(evidence_candidates, judgments):
         print(f"\n[{evidence.id}] {evidence.text[:60]}...")
         print(f"  Source: {evidence.source}")
         print(f"  Confidence: {evidence.confidence:.2f}")
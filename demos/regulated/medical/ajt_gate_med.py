@@ -1,7 +1,13 @@
 
-import json, sys
+import json, mmap, os, sys
+from itertools import chain
 from pathlib import Path
 
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
 def load_policy(p):
     try:
         import yaml
@@ -11,14 +17,26 @@ def load_policy(p):
 
 def read_chunks(p):
     if not p.exists(): return []
-    return [json.loads(l) for l in p.read_text().splitlines() if l.strip()]
+    # mmap the file and walk newlines in place: no decoded str copy of the whole file.
+    out = []
+    with open(p, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0: return out
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos, end = 0, len(mm)
+            while pos < end:
+                nl = mm.find(b"\n", pos)
+                if nl == -1: nl = end
+                line = mm[pos:nl]
+                if line.strip(): out.append(_loads(line))
+                pos = nl + 1
+    return out
 
 def decide(c, ch, policy):
     role="Clinical Triage"
     role_p=policy["roles"][role]
     if not c["evidence"].get("consent_signed"):
         return "STOP","missing_consent"
-    tags={t for x in ch for t in x.get("tags",[])}
+    tags=frozenset(chain.from_iterable(x.get("tags") or () for x in ch))
     for t in role_p["must"]:
         if t not in tags:
             return "STOP","missing_must_evidence"
@@ -34,7 +52,7 @@ def main():
     totals={"TOTAL":0,"ALLOW":0,"REVIEW":0,"STOP":0}
     for fp in cdir.glob("*.json"):
         totals["TOTAL"]+=1
-        c=json.loads(fp.read_text())
+        c=_loads(fp.read_bytes())
         ch=read_chunks(chdir/f"{c['candidate_id']}.jsonl")
         d,_=decide(c,ch,policy)
         totals[d]+=1
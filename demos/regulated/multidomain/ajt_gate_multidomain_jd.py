@@ -1,7 +1,15 @@
 
-import json, sys
+import heapq, json, mmap, os, sqlite3, sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import chain
 from pathlib import Path
 
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
 def load_policy(p: Path):
     try:
         import yaml  # type: ignore
@@ -11,44 +19,155 @@ def load_policy(p: Path):
 
 def read_chunks(p: Path):
     if not p.exists(): return []
-    lines = [l.strip() for l in p.read_text(encoding="utf-8").splitlines() if l.strip()]
-    return [json.loads(l) for l in lines]
-
-def decide(candidate, chunks, policy):
+    # mmap the file and walk newlines in place: no decoded str copy of the whole file.
+    out = []
+    with open(p, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0: return out
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos, end = 0, len(mm)
+            while pos < end:
+                nl = mm.find(b"\n", pos)
+                if nl == -1: nl = end
+                line = mm[pos:nl]
+                if line.strip(): out.append(_loads(line))
+                pos = nl + 1
+    return out
+
+def chunk_tags(chunks):
+    return frozenset(chain.from_iterable(ch.get("tags") or () for ch in chunks))
+
+class TagCache:
+    """On-disk cache of chunk-file tags keyed by (path, mtime, size).
+
+    Repeat runs over unchanged chunk files skip JSON parsing entirely.
+    """
+    def __init__(self, db_path):
+        self.db = sqlite3.connect(str(db_path), timeout=30)
+        self.db.execute("CREATE TABLE IF NOT EXISTS chunk_tags (path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, tags TEXT)")
+
+    def get(self, path, mtime_ns, size):
+        row = self.db.execute("SELECT tags FROM chunk_tags WHERE path=? AND mtime_ns=? AND size=?", (path, mtime_ns, size)).fetchone()
+        return frozenset(json.loads(row[0])) if row else None
+
+    def put(self, path, mtime_ns, size, tags):
+        with self.db:
+            self.db.execute("INSERT OR REPLACE INTO chunk_tags VALUES (?,?,?,?)", (path, mtime_ns, size, json.dumps(list(tags), ensure_ascii=False)))
+
+_tag_caches = {}
+
+def open_tag_cache(db_path):
+    # One connection per process. Forked pool workers inherit _tag_caches, and sqlite
+    # forbids using a parent's connection in the child, so key on the pid too.
+    if db_path is None: return None
+    key = (os.getpid(), db_path)
+    if key not in _tag_caches:
+        _tag_caches[key] = TagCache(db_path)
+    return _tag_caches[key]
+
+def read_chunk_tags(p: Path, cache=None):
+    if cache is None:
+        return chunk_tags(read_chunks(p))
+    try:
+        st = p.stat()
+    except FileNotFoundError:
+        return frozenset()
+    key = str(p.resolve())
+    tags = cache.get(key, st.st_mtime_ns, st.st_size)
+    if tags is None:
+        tags = chunk_tags(read_chunks(p))
+        cache.put(key, st.st_mtime_ns, st.st_size, tags)
+    return tags
+
+def compile_policy(policy):
+    # Normalise role rules once so decide() doesn't redo .get()/list defaults per candidate.
+    # Every policy tag gets a bit; role rules become int masks (Python ints, so no 64-tag cap).
+    # Empty role entries are dropped so decide() still reports them as unknown_role.
+    raw_roles = {role: rp for role, rp in (policy.get("roles") or {}).items() if rp}
+    # Bits go in first-seen order: order doesn't matter, and tags may mix types (YAML 2024 is an int).
+    vocab = dict.fromkeys(t for rp in raw_roles.values() for k in ("must", "must_not", "should") for t in (rp.get(k) or []))
+    tag_bit = {t: 1 << i for i, t in enumerate(vocab)}
+    roles = {}
+    for role, rp in raw_roles.items():
+        must = tuple(rp.get("must") or [])
+        must_not = tuple(rp.get("must_not") or [])
+        should = tuple(rp.get("should") or [])
+        roles[role] = {
+            "must": must, "must_mask": _mask(must, tag_bit),
+            "must_not": must_not, "must_not_mask": _mask(must_not, tag_bit),
+            "should": should, "should_mask": _mask(should, tag_bit),
+        }
+    global_must = tuple((policy.get("global") or {}).get("must_links") or [])
+    return {"roles": roles, "global_must": global_must, "tag_bit": tag_bit}
+
+def _mask(tags, tag_bit):
+    # Tags outside the policy vocabulary can't affect a decision, so they map to 0.
+    m = 0
+    for t in tags:
+        m |= tag_bit.get(t, 0)
+    return m
+
+def decide(candidate, tags, compiled):
     role = candidate.get("applied_role")
-    role_p = (policy.get("roles") or {}).get(role)
+    role_p = compiled["roles"].get(role)
     if not role_p:
         return "STOP", "unknown_role", {"role": role}
 
     evidence = candidate.get("evidence") or {}
 
     # Global must links (presence/true)
-    for k in (policy.get("global") or {}).get("must_links", []) or []:
+    for k in compiled["global_must"]:
         v = evidence.get(k)
         if v is None or v is False or v == "":
             return "STOP", "missing_must_links", {"missing": k}
 
-    tags = {t for ch in chunks for t in (ch.get("tags") or [])}
+    mask = _mask(tags, compiled["tag_bit"])
 
-    # must_not tags
-    for bad in role_p.get("must_not", []) or []:
-        if bad in tags:
-            return "STOP", "policy_violation_must_not", {"tag": bad}
+    # must_not tags: one AND; report the first hit in policy order
+    if mask & role_p["must_not_mask"]:
+        bad = next(t for t in role_p["must_not"] if t in tags)
+        return "STOP", "policy_violation_must_not", {"tag": bad}
 
-    # must tags
-    for t in role_p.get("must", []) or []:
-        if t not in tags:
-            return "STOP", "missing_must_evidence", {"missing_tag": t, "present_tags": sorted(list(tags))[:25]}
+    # must tags: every must bit set; only walk the ordered list to report the first gap
+    must_mask = role_p["must_mask"]
+    if mask & must_mask != must_mask:
+        t = next(t for t in role_p["must"] if t not in tags)
+        return "STOP", "missing_must_evidence", {"missing_tag": t, "present_tags": sorted(list(tags))[:25]}
 
     # should tags are non-blocking; we can route to REVIEW if too many missing (optional)
-    missing_should = [t for t in (role_p.get("should") or []) if t not in tags]
-    if len(missing_should) >= 2 and len(role_p.get("should") or []) >= 2:
-        return "REVIEW", "missing_should_evidence", {"missing_should": missing_should}
+    should = role_p["should"]
+    if role_p["should_mask"] & ~mask:
+        missing_should = [t for t in should if t not in tags]
+        if len(missing_should) >= 2 and len(should) >= 2:
+            return "REVIEW", "missing_should_evidence", {"missing_should": missing_should}
 
     return "ALLOW", None, {}
 
-def run(candidates_dir: Path, chunks_dir: Path, policy_path: Path, out_dir: Path):
-    policy = load_policy(policy_path)
+def list_candidates(candidates_dir: Path):
+    # scandir hands back names without a per-entry stat; name order == sorted(glob()) order.
+    with os.scandir(candidates_dir) as it:
+        names = sorted(e.name for e in it if e.name.endswith(".json"))
+    return [candidates_dir/n for n in names]
+
+# Below this many candidates, process start-up costs more than it saves.
+PARALLEL_MIN_FILES = 256
+
+def process_candidate(fp: Path, chunks_dir: Path, compiled, cache_path=None):
+    c = _loads(fp.read_bytes())
+    cid = c.get("candidate_id")
+    tags = read_chunk_tags(chunks_dir/f"{cid}.jsonl", open_tag_cache(cache_path))
+    decision, reason, detail = decide(c, tags, compiled)
+    return cid, c.get("name"), c.get("applied_role"), decision, reason, detail
+
+def iter_decisions(files, job, workers=None):
+    # Candidates are independent; fan out across processes, results stay in input order.
+    if workers == 1 or len(files) < PARALLEL_MIN_FILES:
+        yield from map(job, files)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        yield from ex.map(job, files, chunksize=64)
+
+def run(candidates_dir: Path, chunks_dir: Path, policy_path: Path, out_dir: Path, workers=None, cache_path=None):
+    compiled = compile_policy(load_policy(policy_path))
     out_dir.mkdir(parents=True, exist_ok=True)
     neg = out_dir/"negative_proof.jsonl"
     review_q = out_dir/"review_queue.json"
@@ -59,39 +178,56 @@ def run(candidates_dir: Path, chunks_dir: Path, policy_path: Path, out_dir: Path
     review_items=[]
     allow_items=[]
 
+    files = list_candidates(candidates_dir)
+    job = partial(process_candidate, chunks_dir=chunks_dir, compiled=compiled,
+                  cache_path=str(cache_path) if cache_path else None)
+
     with neg.open("w", encoding="utf-8") as negf:
-        for fp in sorted(candidates_dir.glob("*.json")):
+        for cid, name, role, decision, reason, detail in iter_decisions(files, job, workers):
+            # Role names repeat across thousands of items; results unpickled from
+            # the pool arrive as fresh copies, so re-share them here.
+            if isinstance(role, str): role = sys.intern(role)
             totals["TOTAL"] += 1
-            c = json.loads(fp.read_text(encoding="utf-8"))
-            ch = read_chunks(chunks_dir/f"{c.get('candidate_id')}.jsonl")
-            decision, reason, detail = decide(c, ch, policy)
             totals[decision] += 1
             if decision == "STOP":
                 reasons[reason] = reasons.get(reason, 0) + 1
-                negf.write(json.dumps({"candidate_id": c.get("candidate_id"), "decision":"STOP", "reason":reason, "detail":detail}, ensure_ascii=False) + "\n")
+                negf.write(json.dumps({"candidate_id": cid, "decision":"STOP", "reason":reason, "detail":detail}, ensure_ascii=False) + "\n")
             elif decision == "REVIEW":
                 reasons[reason] = reasons.get(reason, 0) + 1
-                review_items.append({"candidate_id": c.get("candidate_id"), "name": c.get("name"), "role": c.get("applied_role"), "reason":reason, "detail":detail})
+                review_items.append({"candidate_id": cid, "name": name, "role": role, "reason":reason, "detail":detail})
             else:
-                allow_items.append({"candidate_id": c.get("candidate_id"), "name": c.get("name"), "role": c.get("applied_role")})
+                allow_items.append({"candidate_id": cid, "name": name, "role": role})
 
     review_q.write_text(json.dumps(review_items, ensure_ascii=False, indent=2), encoding="utf-8")
     allow_l.write_text(json.dumps(allow_items, ensure_ascii=False, indent=2), encoding="utf-8")
 
     return totals, reasons, str(neg), str(review_q), str(allow_l)
 
+# Above this many distinct reasons, print only the TOP_REASONS most frequent.
+HEAP_SELECT_MIN_REASONS = 64
+TOP_REASONS = 20
+
+def _by_count(item):
+    return -item[1], item[0]
+
 def main():
     if len(sys.argv) < 5:
-        print("Usage: python ajt_gate_multidomain_jd.py <candidates_dir> <chunks_dir> <policy_yaml> <out_dir>")
+        print("Usage: python ajt_gate_multidomain_jd.py <candidates_dir> <chunks_dir> <policy_yaml> <out_dir> [tag_cache_db]")
         sys.exit(2)
     cdir = Path(sys.argv[1]); chdir = Path(sys.argv[2]); pol = Path(sys.argv[3]); out = Path(sys.argv[4])
-    totals, reasons, neg, rq, al = run(cdir, chdir, pol, out)
+    cache = Path(sys.argv[5]) if len(sys.argv) > 5 else None
+    totals, reasons, neg, rq, al = run(cdir, chdir, pol, out, cache_path=cache)
     print("TOTAL:", totals["TOTAL"])
     print("ALLOW:", totals["ALLOW"])
     print("REVIEW:", totals["REVIEW"])
     print("STOP:", totals["STOP"])
     print("Top reasons:")
-    for k,v in sorted(reasons.items(), key=lambda x:(-x[1], x[0])):
+    # Large reason dicts: partial heap select of the top entries instead of a full sort.
+    if len(reasons) > HEAP_SELECT_MIN_REASONS:
+        top = heapq.nsmallest(TOP_REASONS, reasons.items(), key=_by_count)
+    else:
+        top = sorted(reasons.items(), key=_by_count)
+    for k,v in top:
         print(f"- {k}: {v}")
     print("Artifacts:")
     print(" -", neg)
@@ -6,15 +6,18 @@ Reference implementation of evidence presence check before LLM generation.
 Core functions:
 - should_generate(chunks) → bool (minimal framework-agnostic interface)
 - check_evidence(query, chunks) → dict (structured interface with reason codes)
+- check_evidence_count(query, n) → dict (same, when only the chunk count is known)
+- check_evidence_many(queries, counts) → list of dicts (bulk form of the above)
 
 Single responsibility: Decide if retrieved_chunks is empty before calling LLM.
 This is intentionally trivial (if not chunks). Value is in naming, boundary
 enforcement, and observability.
 """
 
+import sys
 from enum import Enum
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, Sequence, Iterable
 
 
 # ============================================================================
@@ -44,7 +47,7 @@ def should_generate(chunks: List[Dict[str, Any]]) -> bool:
             return None  # Early exit, LLM not called
         return llm.generate(query, chunks)
     """
-    return bool(chunks and len(chunks) > 0)
+    return bool(chunks)
 
 
 # ============================================================================
@@ -59,7 +62,8 @@ def check_evidence(query: str, chunks: List[Dict[str, Any]]) -> Dict[str, str]:
 
     Args:
         query: User query string
-        chunks: List of retrieved chunks (may be empty)
+        chunks: List (or other sized sequence) of retrieved chunks; may be
+            empty or None
 
     Returns:
         Dict with:
@@ -76,8 +80,20 @@ def check_evidence(query: str, chunks: List[Dict[str, Any]]) -> Dict[str, str]:
 
         answer = llm.generate(query, chunks)
     """
-    # Check if chunks list is empty
-    if not chunks or len(chunks) == 0:
+    # Check if chunks list is empty (truthiness already calls __len__)
+    if not chunks:
+        return check_evidence_count(query, 0)
+    return check_evidence_count(query, len(chunks))
+
+
+def check_evidence_count(query: str, n: int) -> Dict[str, str]:
+    """
+    check_evidence() for callers that only know how many chunks were retrieved.
+
+    The decision depends on the chunk count alone, so callers holding large
+    or streamed results need not materialize them.
+    """
+    if n <= 0:
         return {
             "status": "STOP",
             "reason": "EVIDENCE_MISSING",
@@ -94,25 +110,46 @@ def check_evidence(query: str, chunks: List[Dict[str, Any]]) -> Dict[str, str]:
     return {
         "status": "ALLOW",
         "reason": "EVIDENCE_SUFFICIENT",
-        "explanation": f"Found {len(chunks)} chunk(s). Generation allowed."
+        "explanation": _ALLOW_EXPLANATIONS.get(n) or f"Found {n} chunk(s). Generation allowed."
     }
 
 
+def check_evidence_many(queries: Sequence[str], counts: Iterable[int]) -> List[Dict[str, str]]:
+    """
+    Bulk check_evidence_count() over parallel queries and chunk counts.
+
+    A convenience wrapper: it is the same per-item loop a caller would write,
+    not a faster path. Its value is taking counts instead of chunk lists, so
+    any iterable of ints (a list, or e.g. a NumPy array of per-query hit
+    counts) works and chunk contents are never needed.
+
+    Raises:
+        ValueError: if queries and counts differ in length
+    """
+    return [check_evidence_count(q, int(n)) for q, n in zip(queries, counts, strict=True)]
+
+
+# ALLOW explanations for typical top-k sizes, formatted once at import
+_ALLOW_EXPLANATIONS = {n: f"Found {n} chunk(s). Generation allowed." for n in range(1, 65)}
+
+
 # --- Advanced implementation below (for compliance/enterprise use) ---
 
 
-class DecisionType(Enum):
+class DecisionType(str, Enum):
     """
     Decision outcomes from boundary gate.
 
     STOP is a valid, first-class outcome (not an error).
+    Members are str instances, so they compare equal to (and serialize as)
+    their values.
     """
     ALLOW = "ALLOW"
     REVIEW = "REVIEW"
     STOP = "STOP"
 
 
-class StopReason(Enum):
+class StopReason(str, Enum):
     """
     Structured reason codes for STOP outcomes.
 
@@ -141,21 +178,28 @@ class StopReason(Enum):
     DISCRETION_REQUIRED = "STOP.DISCRETION_REQUIRED"
 
 
-class ReviewReason(Enum):
+class ReviewReason(str, Enum):
     """Structured reason codes for REVIEW outcomes."""
     EVIDENCE_CONFLICT = "REVIEW.EVIDENCE_CONFLICT"
     MULTIPLE_INTERPRETATIONS = "REVIEW.MULTIPLE_INTERPRETATIONS"
     DISCRETION_ADVISED = "REVIEW.DISCRETION_ADVISED"
 
 
-@dataclass
+# Dotted reason codes aren't auto-interned; intern them so codes read back
+# from logs/JSON (via sys.intern) share storage with these values.
+for _reason in (*StopReason, *ReviewReason):
+    sys.intern(_reason.value)
+del _reason
+
+
+@dataclass(frozen=True, slots=True)
 class NextAction:
     """Suggested next action for user (NOT automated)."""
     action: str
     description: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BoundaryDecision:
     """
     Output of boundary gate.
@@ -167,6 +211,7 @@ class BoundaryDecision:
     explanation: str
     guidance: Optional[dict] = None
     next_actions: Optional[List[NextAction]] = None
+    philosophy: Optional[str] = None  # Core principle this decision enforces
 
     def is_allowed(self) -> bool:
         """Returns True if answer generation is permitted."""
@@ -181,6 +226,120 @@ class BoundaryDecision:
         return self.decision == DecisionType.STOP
 
 
+# ============================================================================
+# GATE OUTCOMES
+# The gate has only these five outcomes. Each is a private template built once
+# at import; boundary_gate() hands out a copy with its own guidance dict and
+# next_actions list, so callers may mutate what they get back.
+# ============================================================================
+
+# Rule 1: "This system does not automate decisions"
+_STOP_DECISION_AUTOMATION_BLOCKED = BoundaryDecision(
+    decision=DecisionType.STOP,
+    reason=StopReason.DECISION_AUTOMATION_BLOCKED.value,
+    explanation="This system does not automate decisions",
+    guidance={
+        "primary_message": "Decision automation is blocked by design",
+        "philosophy": "This system does not automate decisions"
+    },
+    next_actions=[
+        NextAction(
+            action="route_to_human",
+            description="Route decision request to human decision-maker"
+        ),
+        NextAction(
+            action="reframe_as_information",
+            description="Reframe as information request instead of decision request"
+        )
+    ],
+    philosophy="This system does not automate decisions"
+)
+
+# Rule 2: "Retrieved documents ≠ permission to answer"
+_STOP_PERMISSION_MISSING = BoundaryDecision(
+    decision=DecisionType.STOP,
+    reason=StopReason.PERMISSION_MISSING.value,
+    explanation="Retrieved documents do not include permission to generate answers",
+    guidance={
+        "primary_message": "Retrieved documents ≠ permission to answer",
+        "philosophy": "Retrieval does not imply permission"
+    },
+    next_actions=[
+        NextAction(
+            action="request_permission",
+            description="Request permission from document owner or administrator"
+        ),
+        NextAction(
+            action="add_evidence",
+            description="Add documents that explicitly grant answer permission"
+        ),
+        NextAction(
+            action="reframe_question",
+            description="Reframe question to match available permissions"
+        )
+    ],
+    philosophy="Retrieval does not imply permission"
+)
+
+# Rule 3: Evidence existence check
+_STOP_EVIDENCE_MISSING = BoundaryDecision(
+    decision=DecisionType.STOP,
+    reason=StopReason.EVIDENCE_MISSING.value,
+    explanation="No evidence retrieved for this query",
+    guidance={
+        "primary_message": "Evidence required before answering",
+        "philosophy": "Cannot answer without evidence"
+    },
+    next_actions=[
+        NextAction(
+            action="add_documents",
+            description="Add relevant documents to knowledge base"
+        ),
+        NextAction(
+            action="reframe_question",
+            description="Reframe question to match available documentation"
+        ),
+        NextAction(
+            action="acknowledge_gap",
+            description="Acknowledge evidence gap and defer to human expert"
+        )
+    ],
+    philosophy="Cannot answer without evidence"
+)
+
+# Adapter suggested STOP, but conditions allow answering (suggestion overridden)
+_ALLOW_ADAPTER_OVERRIDE = BoundaryDecision(
+    decision=DecisionType.ALLOW,
+    reason="Answer permitted",
+    explanation="Adapter suggested STOP, but boundary conditions allow answer generation",
+    guidance={
+        "note": "Adapter suggestion is advisory only. Philosophy takes precedence."
+    }
+)
+
+# All checks passed
+_ALLOW_DEFAULT = BoundaryDecision(
+    decision=DecisionType.ALLOW,
+    reason="Answer permitted",
+    explanation="All boundary conditions satisfied. Answer generation permitted.",
+    guidance={
+        "note": "Permission verified. Evidence exists. Not a decision request."
+    }
+)
+
+
+def _fresh(template: BoundaryDecision) -> BoundaryDecision:
+    # Scalar fields and NextAction items are immutable and shared; the containers are not.
+    return BoundaryDecision(
+        decision=template.decision,
+        reason=template.reason,
+        explanation=template.explanation,
+        guidance=dict(template.guidance) if template.guidance is not None else None,
+        next_actions=list(template.next_actions) if template.next_actions is not None else None,
+        philosophy=template.philosophy,
+    )
+
+
 def boundary_gate(
     retrieved_docs: bool,
     permission_to_answer: bool,
@@ -216,77 +375,15 @@ def boundary_gate(
 
     # Rule 1: "This system does not automate decisions"
     if is_decision_request:
-        return BoundaryDecision(
-            decision=DecisionType.STOP,
-            reason=StopReason.DECISION_AUTOMATION_BLOCKED.value,
-            explanation="This system does not automate decisions",
-            guidance={
-                "primary_message": "Decision automation is blocked by design",
-                "philosophy": "This system does not automate decisions"
-            },
-            next_actions=[
-                NextAction(
-                    action="route_to_human",
-                    description="Route decision request to human decision-maker"
-                ),
-                NextAction(
-                    action="reframe_as_information",
-                    description="Reframe as information request instead of decision request"
-                )
-            ]
-        )
+        return _fresh(_STOP_DECISION_AUTOMATION_BLOCKED)
 
     # Rule 2: "Retrieved documents ≠ permission to answer"
     if not permission_to_answer:
-        return BoundaryDecision(
-            decision=DecisionType.STOP,
-            reason=StopReason.PERMISSION_MISSING.value,
-            explanation="Retrieved documents do not include permission to generate answers",
-            guidance={
-                "primary_message": "Retrieved documents ≠ permission to answer",
-                "philosophy": "Retrieval does not imply permission"
-            },
-            next_actions=[
-                NextAction(
-                    action="request_permission",
-                    description="Request permission from document owner or administrator"
-                ),
-                NextAction(
-                    action="add_evidence",
-                    description="Add documents that explicitly grant answer permission"
-                ),
-                NextAction(
-                    action="reframe_question",
-                    description="Reframe question to match available permissions"
-                )
-            ]
-        )
+        return _fresh(_STOP_PERMISSION_MISSING)
 
     # Rule 3: Evidence existence check
     if not retrieved_docs:
-        return BoundaryDecision(
-            decision=DecisionType.STOP,
-            reason=StopReason.EVIDENCE_MISSING.value,
-            explanation="No evidence retrieved for this query",
-            guidance={
-                "primary_message": "Evidence required before answering",
-                "philosophy": "Cannot answer without evidence"
-            },
-            next_actions=[
-                NextAction(
-                    action="add_documents",
-                    description="Add relevant documents to knowledge base"
-                ),
-                NextAction(
-                    action="reframe_question",
-                    description="Reframe question to match available documentation"
-                ),
-                NextAction(
-                    action="acknowledge_gap",
-                    description="Acknowledge evidence gap and defer to human expert"
-                )
-            ]
-        )
+        return _fresh(_STOP_EVIDENCE_MISSING)
 
     # ========================================================================
     # ADAPTER SUGGESTION (Advisory only, non-binding)
@@ -296,14 +393,7 @@ def boundary_gate(
     # This demonstrates that philosophy > adapter logic
     if adapter_suggestion == DecisionType.STOP:
         # Conditions allow answering, adapter suggestion is overridden
-        return BoundaryDecision(
-            decision=DecisionType.ALLOW,
-            reason="Answer permitted",
-            explanation="Adapter suggested STOP, but boundary conditions allow answer generation",
-            guidance={
-                "note": "Adapter suggestion is advisory only. Philosophy takes precedence."
-            }
-        )
+        return _fresh(_ALLOW_ADAPTER_OVERRIDE)
 
     # If adapter suggests ANSWER but we haven't hit STOP yet, that's fine
     # (We already checked all STOP conditions above)
@@ -312,14 +402,7 @@ def boundary_gate(
     # ALL CHECKS PASSED - ALLOW
     # ========================================================================
 
-    return BoundaryDecision(
-        decision=DecisionType.ALLOW,
-        reason="Answer permitted",
-        explanation="All boundary conditions satisfied. Answer generation permitted.",
-        guidance={
-            "note": "Permission verified. Evidence exists. Not a decision request."
-        }
-    )
+    return _fresh(_ALLOW_DEFAULT)
 
 
 # ============================================================================
@@ -338,17 +421,23 @@ def check_boundary(
     This is the function external systems should call.
     Returns a dictionary for easy serialization.
     """
-    adapter_enum = None
-    if adapter_suggestion:
-        adapter_enum = DecisionType[adapter_suggestion]
-
-    decision = boundary_gate(
-        retrieved_docs=retrieved_docs,
-        permission_to_answer=permission_to_answer,
-        is_decision_request=is_decision_request,
-        adapter_suggestion=adapter_enum
-    )
+    # Only an adapter STOP changes the outcome; the lookup still raises
+    # KeyError for names that aren't DecisionType members.
+    adapter_stop = _ADAPTER_IS_STOP[adapter_suggestion] if adapter_suggestion else False
+
+    code = (bool(retrieved_docs) | bool(permission_to_answer) << 1
+            | bool(is_decision_request) << 2 | adapter_stop << 3)
+    # Callers own the result: copy the nested containers too, so mutating any part
+    # of it can't leak into the shared table.
+    entry = _SERIALIZED_BY_CODE[code]
+    return {
+        **entry,
+        "guidance": dict(entry["guidance"]),
+        "next_actions": [dict(a) for a in entry["next_actions"]],
+    }
 
+
+def _serialize_decision(decision: BoundaryDecision) -> dict:
     return {
         "decision": decision.decision.value,
         "reason": decision.reason,
@@ -361,15 +450,34 @@ def check_boundary(
     }
 
 
+_ADAPTER_IS_STOP: Dict[str, bool] = {m.name: m is DecisionType.STOP for m in DecisionType}
+
+# The gate is a pure function of 3 booleans and "did the adapter say STOP", so
+# check_boundary output is precomputed for all 16 inputs and indexed by the
+# bit-packed int code (docs | perm << 1 | decision_request << 2 | stop << 3).
+_SERIALIZED_BY_CODE: Tuple[dict, ...] = tuple(
+    _serialize_decision(boundary_gate(
+        bool(code & 1), bool(code & 2), bool(code & 4),
+        DecisionType.STOP if code & 8 else None,
+    ))
+    for code in range(16)
+)
+
+
 # ============================================================================
 # CLI INTERFACE
 # ============================================================================
 
-if __name__ == "__main__":
-    import sys
+def _main() -> None:
+    """Command-line entry point; CLI-only imports are deferred to here."""
     import json
     import argparse
 
+    try:
+        from orjson import loads as _loads
+    except ImportError:
+        _loads = json.loads
+
     parser = argparse.ArgumentParser(
         description="Stop-first RAG evidence checker (CLI)",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -384,6 +492,9 @@ Examples:
   # Pipe chunks via stdin
   echo '[]' | python gate.py --query "What is the CEO's salary?" --chunks-stdin
 
+  # Only the count is known (no file parsing at all)
+  python gate.py --query "What is the CEO's salary?" --chunks-count 3
+
   # Quick test
   python gate.py --query "test query" --chunks-empty
         """
@@ -394,35 +505,60 @@ Examples:
     chunks_group = parser.add_mutually_exclusive_group(required=True)
     chunks_group.add_argument("--chunks", help="Path to JSON/JSONL file with chunks")
     chunks_group.add_argument("--chunks-stdin", action="store_true", help="Read chunks from stdin")
+    chunks_group.add_argument("--chunks-msgpack", help="Path to msgpack file holding an array of chunks")
+    chunks_group.add_argument("--chunks-count", type=int, help="Number of retrieved chunks (skips loading chunks entirely)")
     chunks_group.add_argument("--chunks-empty", action="store_true", help="Use empty chunks (test STOP)")
 
     parser.add_argument("--output", choices=["json", "text"], default="text", help="Output format")
 
     args = parser.parse_args()
 
-    # Load chunks
-    chunks = []
+    # Load chunks (only the count is needed for the decision)
+    n_chunks = 0
     if args.chunks_empty:
-        chunks = []
+        n_chunks = 0
+    elif args.chunks_count is not None:
+        if args.chunks_count < 0:
+            parser.error("--chunks-count must be a non-negative integer")
+        n_chunks = args.chunks_count
+    elif args.chunks_msgpack:
+        try:
+            import msgpack
+        except ImportError:
+            print("Error: --chunks-msgpack requires the msgpack package (pip install msgpack)", file=sys.stderr)
+            sys.exit(1)
+        try:
+            with open(args.chunks_msgpack, 'rb') as f:
+                chunks = msgpack.unpackb(f.read(), raw=False)
+            n_chunks = len(chunks) if chunks else 0
+        except FileNotFoundError:
+            print(f"Error: File not found: {args.chunks_msgpack}", file=sys.stderr)
+            sys.exit(1)
+        except (ValueError, msgpack.UnpackException) as e:
+            print(f"Error: Invalid msgpack in file: {e}", file=sys.stderr)
+            sys.exit(1)
     elif args.chunks_stdin:
         try:
-            chunks = json.load(sys.stdin)
+            chunks = _loads(sys.stdin.buffer.read())
+            n_chunks = len(chunks) if chunks else 0
         except json.JSONDecodeError as e:
             print(f"Error: Invalid JSON from stdin: {e}", file=sys.stderr)
             sys.exit(1)
     else:
         try:
-            with open(args.chunks, 'r') as f:
+            # Read bytes: both decoders take UTF-8 directly, no text-mode decode pass
+            with open(args.chunks, 'rb') as f:
                 # Try JSONL format first
                 if args.chunks.endswith('.jsonl'):
-                    chunks = []
+                    # Stream: validate each line but keep none of them in memory
                     for line in f:
-                        line = line.strip()
-                        if line:
-                            chunks.append(json.loads(line))
+                        if line.strip():
+                            _loads(line)
+                            n_chunks += 1
                 else:
                     # JSON format
-                    chunks = json.load(f)
+                    chunks = _loads(f.read())
+                    n_chunks = len(chunks) if chunks else 0
         except FileNotFoundError:
             print(f"Error: File not found: {args.chunks}", file=sys.stderr)
             sys.exit(1)
@@ -431,7 +567,7 @@ Examples:
             sys.exit(1)
 
     # Run check
-    decision = check_evidence(args.query, chunks)
+    decision = check_evidence_count(args.query, n_chunks)
 
     # Output
     if args.output == "json":
@@ -439,7 +575,7 @@ Examples:
     else:
         # Human-readable text
         print(f"Query: {args.query}")
-        print(f"Chunks: {len(chunks)}")
+        print(f"Chunks: {n_chunks}")
         print(f"Decision: {decision['status']}")
         print(f"Reason: {decision['reason']}")
         print(f"Explanation: {decision['explanation']}")
@@ -450,3 +586,7 @@ Examples:
         else:
             print("\n✅ LLM generation can PROCEED")
             sys.exit(0)
+
+
+if __name__ == "__main__":
+    _main()
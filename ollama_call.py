@@ -1,19 +1,92 @@
+import asyncio
+import atexit
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+def _dumps(obj) -> bytes:
+    # Always stdlib: it escapes lone surrogates (as requests' json= did) where orjson raises.
+    return json.dumps(obj).encode("utf-8")
 
 OLLAMA_URL = "http://localhost:11434/api/generate"
 MODEL = "qwen3-vl:4b"
 
+# One pooled keep-alive session for all calls instead of a new connection per request.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "http://",
+    HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=Retry(total=2, backoff_factor=0.2)),
+)
+atexit.register(_SESSION.close)
+
+# Everything but the prompt is fixed, so the request body is serialized once up to the
+# prompt value; each call only encodes the prompt string.
+def _payload_prefix(stream: bool) -> bytes:
+    return (
+        b'{"model":' + _dumps(MODEL)
+        + b',"stream":' + (b"true" if stream else b"false")
+        + b',"options":{"temperature":0.2,"top_p":0.9},"prompt":'
+    )
+
+_PAYLOAD_PREFIX = _payload_prefix(False)
+_STREAM_PAYLOAD_PREFIX = _payload_prefix(True)
+_PAYLOAD_SUFFIX = b"}"
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 def call_qwen_vl(prompt: str) -> str:
-    payload = {
-        "model": MODEL,
-        "prompt": prompt,
-        "stream": False,
-        "options": {"temperature": 0.2, "top_p": 0.9},
-    }
-    resp = requests.post(OLLAMA_URL, json=payload, timeout=600)
+    body = _PAYLOAD_PREFIX + _dumps(prompt) + _PAYLOAD_SUFFIX
+    resp = _SESSION.post(OLLAMA_URL, data=body, headers=_JSON_HEADERS, timeout=600)
     resp.raise_for_status()
-    return resp.json()["response"]
+    return _loads(resp.content)["response"]
+
+def stream_qwen_vl(prompt: str) -> Iterator[str]:
+    # Ollama streams one JSON object per line; yield tokens as they arrive so the first one
+    # is usable at time-to-first-token and the full response is never buffered.
+    body = _STREAM_PAYLOAD_PREFIX + _dumps(prompt) + _PAYLOAD_SUFFIX
+    with _SESSION.post(OLLAMA_URL, data=body, headers=_JSON_HEADERS, timeout=600, stream=True) as resp:
+        resp.raise_for_status()
+        for line in resp.iter_lines():
+            if not line:
+                continue
+            obj = _loads(line)
+            # Failures after the 200 header arrive in-band; surface them like raise_for_status does.
+            if "error" in obj:
+                raise requests.HTTPError(obj["error"], response=resp)
+            token = obj.get("response", "")
+            if token:
+                yield token
+            if obj.get("done"):
+                break
+
+def call_qwen_vl_string(prompt: str) -> str:
+    return "".join(stream_qwen_vl(prompt))
+
+def call_many(prompts: List[str], concurrency: int = 8) -> List[str]:
+    # Requests are IO-bound, so threads over the shared pool overlap network RTT and prefill.
+    # Results come back in prompt order.
+    with ThreadPoolExecutor(max_workers=concurrency) as ex:
+        return list(ex.map(call_qwen_vl, prompts))
+
+async def acall_qwen_vl(prompt: str) -> str:
+    # For async callers: the blocking request runs on a worker thread so the event loop keeps serving.
+    return await asyncio.to_thread(call_qwen_vl, prompt)
+
+async def acall_many(prompts: List[str], concurrency: int = 8) -> List[str]:
+    sem = asyncio.Semaphore(concurrency)
+    async def one(prompt: str) -> str:
+        async with sem:
+            return await acall_qwen_vl(prompt)
+    return list(await asyncio.gather(*(one(p) for p in prompts)))
 
 if __name__ == "__main__":
-    print(call_qwen_vl("Return JSON only"))
+    for token in stream_qwen_vl("Return JSON only"):
+        print(token, end="", flush=True)
+    print()
@@ -7,10 +7,56 @@ CI MUST fail if any scenario fails.
 Core Philosophy (tested in every scenario):
 - "Retrieved documents ≠ permission to answer"
 - "This system does not automate decisions"
+
+A decision table and the evidence-count API/CLI are checked alongside them.
 """
 
 import json
-from gate import boundary_gate, DecisionType, StopReason
+import os
+import subprocess
+import sys
+import tempfile
+from gate import (
+    boundary_gate, DecisionType, StopReason,
+    check_evidence, check_evidence_count, check_evidence_many,
+)
+
+try:
+    import pytest
+except ImportError:  # CI runs this file directly with plain python
+    pytest = None
+
+
+# (retrieved_docs, permission_to_answer, is_decision_request, adapter_suggestion)
+#   -> expected decision, expected reason
+CASES = [
+    ((True, False, False, None), DecisionType.STOP, StopReason.PERMISSION_MISSING),
+    ((False, True, False, None), DecisionType.STOP, StopReason.EVIDENCE_MISSING),
+    ((True, True, True, None), DecisionType.STOP, StopReason.DECISION_AUTOMATION_BLOCKED),
+    ((True, False, False, DecisionType.ALLOW), DecisionType.STOP, StopReason.PERMISSION_MISSING),
+    ((True, True, False, DecisionType.STOP), DecisionType.ALLOW, "Answer permitted"),
+    ((True, True, False, None), DecisionType.ALLOW, "Answer permitted"),
+    # Precedence: decision requests first, then permission, then evidence
+    ((False, False, True, None), DecisionType.STOP, StopReason.DECISION_AUTOMATION_BLOCKED),
+    ((False, False, False, None), DecisionType.STOP, StopReason.PERMISSION_MISSING),
+]
+
+
+def check_case(inputs, exp_decision, exp_reason):
+    """Assert one row of CASES (no printing)."""
+    decision = boundary_gate(*inputs)
+    assert decision.decision == exp_decision, \
+        f"FAIL: {inputs} expected {exp_decision.value}, got {decision.decision.value}"
+    assert decision.reason == exp_reason, \
+        f"FAIL: {inputs} expected {exp_reason}, got {decision.reason}"
+    if exp_decision == DecisionType.STOP:
+        assert decision.next_actions, "FAIL: STOP must provide next_actions guidance"
+
+
+if pytest is not None:
+    @pytest.mark.parametrize("inputs,exp_decision,exp_reason", CASES)
+    def test_boundary_case(inputs, exp_decision, exp_reason):
+        check_case(inputs, exp_decision, exp_reason)
 
 
 def test_scenario_1_docs_retrieved_permission_missing():
@@ -40,12 +86,14 @@ def test_scenario_1_docs_retrieved_permission_missing():
     # Assertions
     assert decision.decision == DecisionType.STOP, \
         "FAIL: Should STOP when permission missing"
-    assert decision.reason == StopReason.PERMISSION_MISSING.value, \
+    assert decision.reason == StopReason.PERMISSION_MISSING, \
         f"FAIL: Expected STOP.PERMISSION_MISSING, got {decision.reason}"
     assert decision.next_actions is not None, \
         "FAIL: STOP must provide next_actions guidance"
-    assert "Retrieved documents ≠ permission to answer" in str(decision.guidance), \
+    assert decision.philosophy == "Retrieval does not imply permission", \
         "FAIL: Philosophy statement must be present"
+    assert decision.guidance["primary_message"] == "Retrieved documents ≠ permission to answer", \
+        "FAIL: Core principle must be stated in guidance"
 
     print("✅ PASS: Correctly blocked generation despite document retrieval")
     return True
@@ -76,7 +124,7 @@ def test_scenario_2_no_docs_permission_granted():
     # Assertions
     assert decision.decision == DecisionType.STOP, \
         "FAIL: Should STOP when evidence missing"
-    assert decision.reason == StopReason.EVIDENCE_MISSING.value, \
+    assert decision.reason == StopReason.EVIDENCE_MISSING, \
         f"FAIL: Expected STOP.EVIDENCE_MISSING, got {decision.reason}"
     assert decision.next_actions is not None, \
         "FAIL: STOP must provide next_actions guidance"
@@ -112,10 +160,9 @@ def test_scenario_3_decision_request():
     # Assertions
     assert decision.decision == DecisionType.STOP, \
         "FAIL: Should STOP on decision requests"
-    assert decision.reason == StopReason.DECISION_AUTOMATION_BLOCKED.value, \
+    assert decision.reason == StopReason.DECISION_AUTOMATION_BLOCKED, \
         f"FAIL: Expected STOP.DECISION_AUTOMATION_BLOCKED, got {decision.reason}"
-    assert "This system does not automate decisions" in decision.explanation or \
-           "This system does not automate decisions" in str(decision.guidance), \
+    assert decision.philosophy == "This system does not automate decisions", \
         "FAIL: Philosophy statement must be present"
 
     print("✅ PASS: Correctly blocked decision automation")
@@ -150,7 +197,7 @@ def test_scenario_4_adapter_forces_answer():
     # Assertions
     assert decision.decision == DecisionType.STOP, \
         "FAIL: Philosophy must override adapter suggestion"
-    assert decision.reason == StopReason.PERMISSION_MISSING.value, \
+    assert decision.reason == StopReason.PERMISSION_MISSING, \
         f"FAIL: Expected STOP.PERMISSION_MISSING, got {decision.reason}"
 
     print("✅ PASS: Philosophy correctly overrode adapter suggestion")
@@ -192,6 +239,86 @@ def test_scenario_5_adapter_suggests_stop():
     return True
 
 
+# ============================================================================
+# EVIDENCE-COUNT API AND CLI (silent; no printing)
+# ============================================================================
+
+_GATE_PY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gate.py")
+
+
+def _run_cli(*args):
+    return subprocess.run([sys.executable, _GATE_PY, "--query", "q", *args],
+                          capture_output=True, text=True)
+
+
+def test_check_evidence_count():
+    stop = check_evidence_count("why?", 0)
+    assert stop["status"] == "STOP" and stop["reason"] == "EVIDENCE_MISSING", \
+        f"FAIL: 0 chunks must STOP, got {stop}"
+    assert "'why?'" in stop["explanation"], "FAIL: STOP explanation must name the query"
+    assert check_evidence_count("why?", -1) == stop, "FAIL: negative count must STOP like 0"
+    for n in (1, 3, 64, 65, 1000):
+        allow = check_evidence_count("why?", n)
+        assert allow == {"status": "ALLOW", "reason": "EVIDENCE_SUFFICIENT",
+                         "explanation": f"Found {n} chunk(s). Generation allowed."}, \
+            f"FAIL: {n} chunks must ALLOW, got {allow}"
+        assert allow == check_evidence("why?", [{}] * n), \
+            "FAIL: check_evidence_count must match check_evidence"
+
+
+def test_check_evidence_many():
+    queries, counts = ["a", "b", "c"], [0, 2, 70]
+    expected = [check_evidence_count(q, n) for q, n in zip(queries, counts)]
+    assert check_evidence_many(queries, counts) == expected, "FAIL: bulk must match per-item"
+    assert check_evidence_many(queries, iter(counts)) == expected, \
+        "FAIL: counts may be any iterable"
+    assert check_evidence_many([], []) == [], "FAIL: empty input must give empty output"
+    try:
+        check_evidence_many(queries, counts[:2])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("FAIL: length mismatch must raise ValueError")
+
+
+def test_cli_chunks_count():
+    res = _run_cli("--chunks-count", "2", "--output", "json")
+    assert res.returncode == 0, f"FAIL: --chunks-count 2 exited {res.returncode}"
+    assert json.loads(res.stdout)["status"] == "ALLOW", "FAIL: --chunks-count 2 must ALLOW"
+    res = _run_cli("--chunks-count", "0", "--output", "json")
+    assert json.loads(res.stdout)["status"] == "STOP", "FAIL: --chunks-count 0 must STOP"
+    res = _run_cli("--chunks-count", "-1")
+    assert res.returncode == 2 and "non-negative" in res.stderr, \
+        "FAIL: negative --chunks-count must be a usage error"
+
+
+def test_cli_chunks_msgpack():
+    try:
+        import msgpack
+    except ImportError:
+        msgpack = None
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "chunks.msgpack")
+        with open(path, "wb") as f:
+            f.write(msgpack.packb([{"text": "a"}, {"text": "b"}]) if msgpack else b"\x92\x80\x80")
+        res = _run_cli("--chunks-msgpack", path, "--output", "json")
+    if msgpack is None:
+        # Optional dependency: must fail with a clear message, not a traceback
+        assert res.returncode == 1 and "requires the msgpack package" in res.stderr, \
+            "FAIL: --chunks-msgpack without msgpack must explain the missing dependency"
+        return
+    assert res.returncode == 0, f"FAIL: --chunks-msgpack exited {res.returncode}"
+    assert json.loads(res.stdout)["status"] == "ALLOW", "FAIL: 2 msgpack chunks must ALLOW"
+
+
+EVIDENCE_TESTS = [
+    test_check_evidence_count,
+    test_check_evidence_many,
+    test_cli_chunks_count,
+    test_cli_chunks_msgpack,
+]
+
+
 def run_all_tests():
     """
     Run all 5 core scenarios.
@@ -228,6 +355,25 @@ def run_all_tests():
             print(f"❌ ERROR: {e}")
             results.append((name, False))
 
+    # Decision table (silent; the scenarios print their own detail).
+    # Reported on its own line, not counted as a scenario.
+    table_ok = True
+    try:
+        for case in CASES:
+            check_case(*case)
+    except AssertionError as e:
+        print(f"❌ FAIL: {e}")
+        table_ok = False
+
+    # Evidence-count API and CLI, reported like the decision table
+    evidence_ok = True
+    for test_func in EVIDENCE_TESTS:
+        try:
+            test_func()
+        except AssertionError as e:
+            print(f"❌ FAIL: {e}")
+            evidence_ok = False
+
     # Summary
     print("\n" + "=" * 70)
     print("TEST SUMMARY")
@@ -242,8 +388,10 @@ def run_all_tests():
 
     print()
     print(f"Results: {passed}/{total} scenarios passed")
+    print(f"Decision table: {'✅ PASS' if table_ok else '❌ FAIL'} ({len(CASES)} cases)")
+    print(f"Evidence API: {'✅ PASS' if evidence_ok else '❌ FAIL'} ({len(EVIDENCE_TESTS)} checks)")
 
-    if passed == total:
+    if passed == total and table_ok and evidence_ok:
         print("\n✅ ALL TESTS PASSED - BOUNDARY SPEC VALIDATED")
         print()
         print("Philosophy enforced:")
@@ -257,49 +405,52 @@ def run_all_tests():
         return 1  # Failure exit code for CI
 
 
+# Static report contents; serialized once at import
+TEST_REPORT = {
+    "test_suite": "Boundary Specification Core Scenarios",
+    "philosophy": [
+        "Retrieved documents ≠ permission to answer",
+        "This system does not automate decisions"
+    ],
+    "scenarios": [
+        {
+            "id": 1,
+            "name": "Documents Retrieved + Permission Missing",
+            "expected": "STOP.PERMISSION_MISSING"
+        },
+        {
+            "id": 2,
+            "name": "No Documents + Permission Granted",
+            "expected": "STOP.EVIDENCE_MISSING"
+        },
+        {
+            "id": 3,
+            "name": "Decision Request",
+            "expected": "STOP.DECISION_AUTOMATION_BLOCKED"
+        },
+        {
+            "id": 4,
+            "name": "Adapter Forces ANSWER",
+            "expected": "STOP (philosophy overrides adapter)"
+        },
+        {
+            "id": 5,
+            "name": "Adapter Suggests STOP",
+            "expected": "ALLOW (adapter is advisory)"
+        }
+    ]
+}
+_TEST_REPORT_BYTES = json.dumps(TEST_REPORT, indent=2).encode("utf-8")
+
+
 def generate_test_report():
     """
     Generate test report for CI artifact.
 
     This report should be archived with every CI build.
     """
-    report = {
-        "test_suite": "Boundary Specification Core Scenarios",
-        "philosophy": [
-            "Retrieved documents ≠ permission to answer",
-            "This system does not automate decisions"
-        ],
-        "scenarios": [
-            {
-                "id": 1,
-                "name": "Documents Retrieved + Permission Missing",
-                "expected": "STOP.PERMISSION_MISSING"
-            },
-            {
-                "id": 2,
-                "name": "No Documents + Permission Granted",
-                "expected": "STOP.EVIDENCE_MISSING"
-            },
-            {
-                "id": 3,
-                "name": "Decision Request",
-                "expected": "STOP.DECISION_AUTOMATION_BLOCKED"
-            },
-            {
-                "id": 4,
-                "name": "Adapter Forces ANSWER",
-                "expected": "STOP (philosophy overrides adapter)"
-            },
-            {
-                "id": 5,
-                "name": "Adapter Suggests STOP",
-                "expected": "ALLOW (adapter is advisory)"
-            }
-        ]
-    }
-
-    with open("test_report.json", "w") as f:
-        json.dump(report, f, indent=2)
+    with open("test_report.json", "wb") as f:
+        f.write(_TEST_REPORT_BYTES)
 
     print("\n📄 Test report generated: test_report.json")
 